@@ -1,9 +1,133 @@
 #! /usr/bin/env python3
 
+import collections.abc
+import functools
+import itertools
+import operator
 import os
 import re
 
 
+# The frame number pattern used when none is given. File names are split on the last group of numbers in the name.
+DEFAULT_FRAME_NUMBER_PATTERN = r"(.*?)(-?(?<!\d)\d+)(\D*)\Z"
+
+
+# ======================================================================================================================
+@functools.lru_cache(maxsize=256)
+def _parse_framespec(framespec: str,
+                     step_delimiter: str) -> tuple:
+    """
+    Given a framespec, return the ranges it is made of, along with whether those ranges are already in order (each one
+    starting after the previous one ends). The results are cached, so repeatedly converting the same framespec (for
+    example, a UI that polls the files list) only pays for the parsing once. Only the ranges are cached, not the
+    integers they expand to, so the cache stays small no matter how many frames a framespec covers.
+
+        For example, given a string like:
+            1-10x2,22-30,42
+
+        Return a tuple like:
+            ((range(1, 11, 2), range(22, 31), (42,)), True)
+
+    :param framespec:
+        The string that contains the frames in a condensed, framespec format.
+    :param step_delimiter:
+        The (regex escaped) string that is used to identify the step size.
+
+    :return:
+        A tuple containing a tuple of ranges (single frames are one item tuples) and a boolean that is True if the
+        ranges are in order.
+    """
+
+    ranges = list()
+    in_order = True
+    last = None
+
+    chunks = framespec.split(",")
+    for chunk in chunks:
+        if step_delimiter in chunk:
+            range_str, step_str = chunk.split(step_delimiter)
+        elif "-" not in chunk:
+            # A single frame needs no range or step handling.
+            start = int(chunk)
+            if last is not None and start <= last:
+                in_order = False
+            ranges.append((start,))
+            last = start
+            continue
+        else:
+            range_str = chunk
+            step_str = "1"
+
+        if "--" in range_str:
+            start_str, _, end_str = range_str.rpartition("--")
+            end_str = "-" + end_str
+        elif "-" in range_str:
+            start_str, _, end_str = range_str.rpartition("-")
+        else:
+            start_str = end_str = range_str
+
+        start = int(start_str)
+        end = int(end_str)
+        step = int(step_str)
+
+        if start > end:
+            start, end = end, start
+
+        if start != end:
+            frames = range(start, end + 1, step)
+        else:
+            frames = (start,)
+
+        if not frames:
+            continue
+        if last is not None and frames[0] <= last:
+            in_order = False
+        ranges.append(frames)
+        last = frames[-1]
+
+    return tuple(ranges), in_order
+
+
+# ======================================================================================================================
+def _split_last_number(file_n: str) -> tuple | None:
+    """
+    Splits a file name into the text before the last number, the last number itself (including a leading minus sign if
+    there is one), and the text after it. This is a hand-rolled equivalent of matching the default frame number pattern
+    and is used in its place because walking back from the end of the name is cheaper than running the regex.
+
+        For example, given:
+            file.-0012.ext
+
+        Returns:
+            ("file.", "-0012", ".ext")
+
+    :param file_n:
+        The file name (without a path).
+
+    :return:
+        A tuple of the prefix, the frame number (as a string), and the postfix. If there is no number in the file name,
+        or the prefix contains a newline (which the default pattern does not match), None is returned.
+    """
+
+    end = len(file_n)
+    while end and not file_n[end - 1].isdecimal():
+        end -= 1
+    if not end:
+        return None
+
+    start = end - 1
+    while start and file_n[start - 1].isdecimal():
+        start -= 1
+    if start and file_n[start - 1] == "-":
+        start -= 1
+
+    prefix_str = file_n[:start]
+    if "\n" in prefix_str:
+        return None
+
+    return prefix_str, file_n[start:end], file_n[end:]
+
+
 # ======================================================================================================================
 class Framespec(object):
     """
@@ -69,6 +193,26 @@ class Framespec(object):
         file.30.ext
     """
 
+    # The object holds a fixed set of attributes, so they are stored in slots rather than a per-instance dictionary.
+    __slots__ = ("_frame_number_pattern",
+                 "step_delimiter",
+                 "_framespec_pattern",
+                 "prefix_group_numbers",
+                 "frame_group_num",
+                 "postfix_group_numbers",
+                 "two_pass_sorting",
+                 "padding",
+                 "_frame_number_re",
+                 "_framespec_re",
+                 "_files_list",
+                 "_condensed_files_str",
+                 "_frames_list",
+                 "_framespec_str",
+                 "_condensed_prefix_str",
+                 "_condensed_postfix_str",
+                 "_files_padding",
+                 "_frame_ranges")
+
     # ------------------------------------------------------------------------------------------------------------------
     def __init__(self,
                  step_delimiter: str = "x",
@@ -79,7 +223,7 @@ class Framespec(object):
                  two_pass_sorting: bool = True,
                  framespec_pattern: str | None = None,
                  padding: int | None = None):
-        """
+        r"""
         Set up some basic object level variables.
 
         :param step_delimiter:
@@ -87,7 +231,7 @@ class Framespec(object):
             see a framespec that looks like this: 1-10x2. If omitted, defaults to 'x'.
         :param frame_number_pattern:
             The regex pattern that is used to extract frame numbers from the file name. If None, then a default regex
-            pattern is used. Defaults to None. The default regex pattern is: (.*?)(-?\d+)(?!.*\d)(.*)
+            pattern is used. Defaults to None. The default regex pattern is: (.*?)(-?(?<!\d)\d+)(\D*)\Z
 
             If the default regex pattern is used, the frame number is assumed to be the last group of numbers in a file
             name. If there are more than one set of numbers in the file name, then only the last set is used as a frame
@@ -131,8 +275,9 @@ class Framespec(object):
             to None. The default pattern is: (?:-?\d+(?:-?-\d+)?(?:x\d+)?(?:,)?)+
         :param padding:
             The amount of padding to use when converting the framespec string to a list of frames. If None, then the
-            amount of padding will be based on the longest frame number. If no padding is desired, padding should be set
-            to 0. Defaults to None.
+            amount of padding will be based on the longest frame number (including the minus sign of negative frame
+            numbers). This automatic padding is worked out separately for each condensed file string that is set. If no
+            padding is desired, padding should be set to 0. Defaults to None.
 
         :return:
                 Nothing.
@@ -146,13 +291,13 @@ class Framespec(object):
         assert type(two_pass_sorting) is bool
 
         if frame_number_pattern is None:
-            self.frame_number_pattern = r"(.*?)(-?\d+)(?!.*\d)(.*)"
+            self.frame_number_pattern = DEFAULT_FRAME_NUMBER_PATTERN
         else:
             self.frame_number_pattern = frame_number_pattern
 
         self.step_delimiter = self._process_step_delimiter(step_delimiter)
         if framespec_pattern is None:
-            self.framespec_pattern = r'(?:-?\d+(?:-?-\d+)?(?:' + self.step_delimiter + '\d+)?(?:,)?)+'
+            self.framespec_pattern = r'(?:-?\d+(?:-?-\d+)?(?:' + self.step_delimiter + r'\d+)?(?:,)?)+'
         else:
             self.framespec_pattern = framespec_pattern
 
@@ -179,6 +324,10 @@ class Framespec(object):
         self._condensed_files_str = ""
         self._frames_list = list()
         self._framespec_str = ""
+        self._condensed_prefix_str = ""
+        self._condensed_postfix_str = ""
+        self._files_padding = None
+        self._frame_ranges = None
 
     # ------------------------------------------------------------------------------------------------------------------
     @staticmethod
@@ -203,6 +352,70 @@ class Framespec(object):
 
         return output
 
+    # ------------------------------------------------------------------------------------------------------------------
+    @property
+    def frame_number_pattern(self) -> str:
+        """
+        Return the regex pattern that is used to extract frame numbers from file names.
+
+        :return:
+            The regex pattern.
+        """
+
+        return self._frame_number_pattern
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @frame_number_pattern.setter
+    def frame_number_pattern(self,
+                             pattern: str):
+        """
+        Set the regex pattern that is used to extract frame numbers from file names. The pattern is compiled here, so
+        that it is only compiled once no matter how many files it is matched against.
+
+        :param pattern:
+            The regex pattern.
+
+        :return:
+            Nothing.
+        """
+
+        assert type(pattern) is str
+
+        self._frame_number_re = re.compile(pattern)
+        self._frame_number_pattern = pattern
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @property
+    def framespec_pattern(self) -> str:
+        """
+        Return the regex pattern that is used to find the framespec in a condensed file string.
+
+        :return:
+            The regex pattern.
+        """
+
+        return self._framespec_pattern
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @framespec_pattern.setter
+    def framespec_pattern(self,
+                          pattern: str):
+        """
+        Set the regex pattern that is used to find the framespec in a condensed file string. The pattern is compiled
+        here, so that it is only compiled once no matter how many strings it is searched in.
+
+        :param pattern:
+            The regex pattern.
+
+        :return:
+            Nothing.
+        """
+
+        assert type(pattern) is str
+
+        self._framespec_re = re.compile(pattern)
+        self._framespec_pattern = pattern
+
     # ------------------------------------------------------------------------------------------------------------------
     @property
     def files_list(self) -> list:
@@ -213,6 +426,15 @@ class Framespec(object):
             A list of file names with paths.
         """
 
+        if self._files_list is None:
+            # The file names are built straight from the frame ranges, so the frames never have to be expanded into a
+            # list of their own.
+            self._files_list = self._frames_to_files_list(self._condensed_prefix_str,
+                                                          itertools.chain.from_iterable(self._frame_ranges),
+                                                          self._condensed_postfix_str,
+                                                          self._files_padding)
+            self._release_frame_ranges()
+
         return self._files_list
 
     # ------------------------------------------------------------------------------------------------------------------
@@ -230,8 +452,9 @@ class Framespec(object):
         """
 
         assert type(files_p) is list
-        for file_p in files_p:
-            assert type(file_p) is str
+        if __debug__:
+            for file_p in files_p:
+                assert type(file_p) is str
 
         self._process_files_list(files_p)
 
@@ -245,6 +468,9 @@ class Framespec(object):
             The file list as a single framespec string.
         """
 
+        if self._condensed_files_str is None:
+            self._condensed_files_str = f"{self._condensed_prefix_str}{self.framespec_str}{self._condensed_postfix_str}"
+
         return self._condensed_files_str
 
     # ------------------------------------------------------------------------------------------------------------------
@@ -276,6 +502,10 @@ class Framespec(object):
             A list of integers.
         """
 
+        if self._frames_list is None:
+            self._frames_list = list(itertools.chain.from_iterable(self._frame_ranges))
+            self._release_frame_ranges()
+
         return self._frames_list
 
     # ------------------------------------------------------------------------------------------------------------------
@@ -293,8 +523,9 @@ class Framespec(object):
         """
 
         assert type(integers) is list
-        for integer in integers:
-            assert type(integer) is int
+        if __debug__:
+            for integer in integers:
+                assert type(integer) is int
 
         self._process_integers_list(integers)
 
@@ -308,6 +539,14 @@ class Framespec(object):
             The framespec list as a single framespec string.
         """
 
+        if self._framespec_str is None:
+            # Only a files list leaves the framespec string to be built, and its frames are held as a single tuple.
+            if self._frame_ranges:
+                self._framespec_str = self._integers_list_to_framespec(self._frame_ranges[0])
+            else:
+                self._framespec_str = ""
+            self._release_frame_ranges()
+
         return self._framespec_str
 
     # ------------------------------------------------------------------------------------------------------------------
@@ -338,22 +577,50 @@ class Framespec(object):
             The framespec list as a single framespec string.
         """
 
-        if not self._frames_list:
+        frames = self.frames_list
+        if not frames:
             return []
 
-        return self._list_missing_integers(self._frames_list)
+        return self._list_missing_integers(frames)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def _release_frame_ranges(self):
+        """
+        Drops the frame ranges once the frames list, the framespec string, and the files list have all been built. At
+        that point nothing needs the ranges anymore, and only one copy of the frames is kept.
+
+        :return:
+            Nothing.
+        """
+
+        if self._frames_list is not None and self._framespec_str is not None and self._files_list is not None:
+            self._frame_ranges = None
 
     # ------------------------------------------------------------------------------------------------------------------
-    def _convert_grouped_list_into_string(self,
-                                          grouped_list: list) -> str:
+    def _group_bounds_to_string(self,
+                                integers: list[int],
+                                starts: list[int],
+                                ends: list[int]) -> str:
         """
-        Given a grouped list, return a string that is in the framespec format.
+        Given a list of integers and the boundaries of the groups they were split into, return a string that is in the
+        framespec format. Only the first two and the last integer of each group are needed, so the groups are read
+        straight out of the original list rather than being copied into sub-lists first.
+
+        :param integers:
+            A list (or tuple) of integers.
 
-        :param grouped_list:
-            A list of integers, grouped into sub-lists by step size.
+            For example:
+                [1, 2, 3, 5, 7, 9, 100, 110, 120, 192]
+        :param starts:
+            The index of the first integer of each group.
 
             For example:
-                [[1,2,3], [5, 7, 9], [100, 110, 120], [192]]
+                [0, 3, 6, 9]
+        :param ends:
+            The index of the last integer of each group.
+
+            For example:
+                [2, 5, 8, 9]
 
         :return:
             A framespec string.
@@ -362,41 +629,46 @@ class Framespec(object):
                 1-3,5-9x2,100-120x10,192
         """
 
-        assert type(grouped_list) is list
-        for item in grouped_list:
-            assert type(item) is list
-            for sub_item in item:
-                assert type(sub_item) is int
+        assert type(integers) in (list, tuple)
+        assert type(starts) is list
+        assert type(ends) is list
+
+        step_delimiter = self.step_delimiter
 
-        for i, chunk in enumerate(grouped_list):
-            if len(chunk) == 1:
-                grouped_list[i] = str(chunk[0])
+        output = list()
+        for start, end in zip(starts, ends):
+            first = integers[start]
+            if start == end:
+                output.append(str(first))
             else:
-                step_size = chunk[1] - chunk[0]
-                first = chunk[0]
-                last = chunk[-1]
+                step_size = integers[start + 1] - first
+                last = integers[end]
                 if step_size != 1:
-                    grouped_list[i] = f"{first}-{last}{self.step_delimiter}{step_size}"
+                    output.append(f"{first}-{last}{step_delimiter}{step_size}")
                 else:
-                    grouped_list[i] = f"{first}-{last}"
+                    output.append(f"{first}-{last}")
 
-        return ",".join(grouped_list)
+        return ",".join(output)
 
     # ------------------------------------------------------------------------------------------------------------------
-    def _group_list_by_step_size(self,
-                                 integers: list[int],
-                                 post_cleanup: bool = True) -> list:
+    def _group_bounds_by_step_size(self,
+                                   integers: list[int],
+                                   post_cleanup: bool = True) -> tuple:
         """
-        Given a list of integers, return the same list, but grouped into sub-lists by step size.
+        Given a list of integers, work out how to split it into groups by step size. The groups are returned as the
+        indices of their first and last integers rather than as sub-lists, so that no integers have to be copied.
 
         For example, given:
             [1, 2, 3, 5, 7, 9, 20, 30, 40]
 
-        Returns:
+        The groups are:
             [[1,2,3], [5,7,9], [20,30,40]]
 
+        So this returns:
+            ([0, 3, 6], [2, 5, 8])
+
         :param integers:
-            A list of integers.
+            A list (or tuple) of integers.
         :param post_cleanup:
             If True, then a second pass will be made through the resulting groupings to see if perhaps some
             values at the end of a group might not make more sense in the next group. This can fix issues where you have
@@ -406,112 +678,192 @@ class Framespec(object):
             sequences).
 
         :return:
-            A list of lists, where each sub-list is a sequence of numbers that differ from each other by the same step
-            size.
+            A tuple of two lists. The first holds the index of the first integer of each group, the second holds the
+            index of the last integer of each group. Each group is a sequence of numbers that differ from each other by
+            the same step size.
         """
 
-        assert type(integers) is list
-        for item in integers:
-            assert type(item) is int
+        assert type(integers) in (list, tuple)
+        # The integers have already been validated by the public setters, so only spot-check the first one here.
+        assert not integers or type(integers[0]) is int
         assert type(post_cleanup) is bool
 
         if len(integers) == 1:
-            return [[integers[0]]]
+            return [0], [0]
 
         if len(integers) == 2:
-            return [[integers[0]], [integers[1]]]
+            return [0, 1], [0, 1]
+
+        diffs = list(map(operator.sub, integers[1:], integers))
+
+        # Most sequences with a step (every other frame, every tenth frame) are a single progression, which is a single
+        # group. There is nothing to split and nothing to clean up.
+        if diffs[0] and diffs.count(diffs[0]) == len(diffs):
+            return [0], [len(diffs)]
+
+        if 0 not in diffs:
+            starts, ends = self._group_bounds_from_diffs(diffs)
+        else:
+            starts, ends = self._group_bounds_from_diffs_with_duplicates(diffs)
+
+        if post_cleanup and len(starts) > 1:
+            self._post_cleanup(integers, starts, ends)
+
+        return starts, ends
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @staticmethod
+    def _group_bounds_from_diffs(diffs: list[int]) -> tuple:
+        """
+        Given the differences between each neighboring pair of a list of integers (that contains no duplicates), return
+        the boundaries of the groups those integers split into by step size.
+
+        A group ends on the first integer where the step size coming in differs from the step size going out. That
+        integer is the last member of its group, and the next integer starts a new group. Because of this, the boundaries
+        can be found by comparing the list of differences against itself (offset by one).
+
+        :param diffs:
+            A list of the differences between each integer and the one that follows it. Holds at least two values.
+
+        :return:
+            A tuple of two lists: the index of the first integer of each group, and the index of the last integer of
+            each group.
+        """
+
+        candidates = itertools.compress(range(1, len(diffs)), map(operator.ne, diffs, diffs[1:]))
 
-        seq_list = list()
+        starts = list()
+        ends = list()
+        start = 0
+        for i in candidates:
+            # Every group holds at least two integers, so a boundary immediately after the start is ignored.
+            if i > start:
+                starts.append(start)
+                ends.append(i)
+                start = i + 1
 
-        curr_sub_list = list()
-        start_new_sub_list = True
-        for i, integer in enumerate(integers):
+        # There is one more integer than there are differences.
+        if start <= len(diffs):
+            starts.append(start)
+            ends.append(len(diffs))
 
-            if start_new_sub_list:
-                curr_sub_list.append(integer)
-                start_new_sub_list = False
+        return starts, ends
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @staticmethod
+    def _group_bounds_from_diffs_with_duplicates(diffs: list[int]) -> tuple:
+        """
+        Given the differences between each neighboring pair of a list of integers (that may contain duplicates), return
+        the boundaries of the groups those integers split into by step size. This walks the list one integer at a time.
+
+        :param diffs:
+            A list of the differences between each integer and the one that follows it. Holds at least two values.
+
+        :return:
+            A tuple of two lists: the index of the first integer of each group, and the index of the last integer of
+            each group.
+        """
+
+        starts = list()
+        ends = list()
+
+        # Every integer is added to the end of the current group or starts the next one, so a group is fully described
+        # by where it starts and how many integers it holds. A length of 0 means the next integer starts a new group.
+        curr_start = 0
+        curr_len = 0
+        last_i = len(diffs)
+        for i in range(last_i + 1):
+
+            if curr_len == 0:
+                curr_start = i
+                curr_len = 1
                 continue
 
-            back_diff = integer - integers[i - 1]
-            try:
-                forward_diff = integers[i + 1] - integer
-            except IndexError:
+            back_diff = diffs[i - 1]
+            if i < last_i:
+                forward_diff = diffs[i]
+            else:
                 forward_diff = None
 
             if forward_diff:
                 if back_diff != forward_diff:
-                    curr_sub_list.append(integer)
-                    seq_list.append(curr_sub_list)
-                    curr_sub_list = list()
-                    start_new_sub_list = True
+                    starts.append(curr_start)
+                    ends.append(i)
+                    curr_len = 0
                     continue
             else:
-                back_back_diff = integers[i - 1] - integers[i - 2]
-                if back_back_diff == back_diff:
-                    curr_sub_list.append(integer)
-                elif len(curr_sub_list) == 1:
-                    curr_sub_list.append(integer)
+                # A group that only holds one integer so far always takes the next one. Checking that first also means
+                # the difference before the previous one is only looked up when it exists.
+                if curr_len == 1 or diffs[i - 2] == back_diff:
+                    curr_len += 1
                 else:
-                    seq_list.append(curr_sub_list)
-                    curr_sub_list = [integer]
+                    starts.append(curr_start)
+                    ends.append(i - 1)
+                    curr_start = i
+                    curr_len = 1
                 continue
 
-            curr_sub_list.append(integer)
-
-        if curr_sub_list:
-            seq_list.append(curr_sub_list)
+            curr_len += 1
 
-        if post_cleanup and len(seq_list) > 1:
-            seq_list = self._post_cleanup(seq_list)
+        if curr_len:
+            starts.append(curr_start)
+            ends.append(curr_start + curr_len - 1)
 
-        return seq_list
+        return starts, ends
 
     # ----------------------------------------------------------------------------------------------------------------------
     @staticmethod
-    def _post_cleanup(seq_list: list) -> list:
+    def _post_cleanup(integers: list[int],
+                      starts: list[int],
+                      ends: list[int]):
         """
-        Perform a cleanup of the sequence list. For example, if the original sequence list was [[1, 2], [4, 6, 8, 10]]
-        this function will readjust it so that the sequence list is [[1], [2, 4, 6, 8, 10]]. The difference is that the
-        2 is shifted to the second section where it makes more sense.
+        Perform a cleanup of the group boundaries. For example, if the original groups were [[1, 2], [4, 6, 8, 10]]
+        this function will readjust them so that the groups are [[1], [2, 4, 6, 8, 10]]. The difference is that the
+        2 is shifted to the second group where it makes more sense. Because the groups are contiguous runs of the same
+        list, shifting a value only moves the boundary between two groups.
 
-        :param seq_list:
-            A list of lists of integers. Example: [[1, 2], [4, 6, 8, 10]]
+        :param integers:
+            The list of integers that was grouped. Example: [1, 2, 4, 6, 8, 10]
+        :param starts:
+            The index of the first integer of each group. Modified in place. Example: [0, 2]
+        :param ends:
+            The index of the last integer of each group. Modified in place. Example: [1, 5]
 
         :return:
-            The same list, but with some numbers shifted from one section to another if they make more sense in
-            the new section.
+            Nothing.
         """
 
-        # Look at every chunk except the last one
-        for i, curr_chunk in enumerate(seq_list[:-1]):
+        # Set to 1 when the current group was handed a value by the group before it. Groups are compared using their
+        # length from before any values were moved, so this amount is subtracted back out.
+        received = 0
+
+        # Look at every group except the last one
+        for i in range(len(starts) - 1):
 
-            # Only deal with chunks that have more than one element
-            if len(curr_chunk) <= 0:
+            # Only deal with groups that have more than one element
+            curr_end = ends[i]
+            curr_len = curr_end - starts[i] + 1 - received
+            received = 0
+            if curr_len < 2:
                 continue
 
-            next_chunk = seq_list[i + 1]
-            next_chunk_len = len(next_chunk)
+            next_start = starts[i + 1]
+            next_len = ends[i + 1] - next_start + 1
 
-            # Only move items if the next chunk is longer than the current chunk
-            if next_chunk_len <= len(curr_chunk):
+            # Only move items if the next group is longer than the current group
+            if next_len <= curr_len:
                 continue
 
-            curr_chunk_last_value = curr_chunk[-1]
-            next_chunk_first_value = next_chunk[0]
-            curr_to_next_diff = next_chunk_first_value - curr_chunk_last_value
+            # No need to worry about IndexErrors because the next group is always > than 1 element long
+            next_step_size = integers[next_start + 1] - integers[next_start]
 
-            # No need to worry about IndexErrors because the next chunk is always > than 1 element long
-            next_chunk_step_size = next_chunk[1] - next_chunk[0]
-
-            # If the step size is the same it means this element probably should be in the next section.
-            if curr_to_next_diff != next_chunk_step_size:
+            # If the step size is the same it means this element probably should be in the next group.
+            if integers[next_start] - integers[curr_end] != next_step_size:
                 continue
 
-            value_to_move = curr_chunk[-1]
-            seq_list[i] = seq_list[i][:-1]
-            seq_list[i + 1] = [value_to_move] + seq_list[i + 1]
-
-        return seq_list
+            ends[i] = curr_end - 1
+            starts[i + 1] = next_start - 1
+            received = 1
 
     # ------------------------------------------------------------------------------------------------------------------
     def _integers_list_to_framespec(self,
@@ -529,33 +881,119 @@ class Framespec(object):
         return: 1-5x2,22
 
         :param integers:
-            A list of integers that we want to compress to a framespec string.
+            A list (or tuple) of integers that we want to compress to a framespec string.
 
         :return:
             A framespec string that represents the list of integers in a compressed format.
         """
 
-        assert type(integers) is list
-        for integer in integers:
-            assert type(integer) is int
+        assert type(integers) in (list, tuple)
+        assert not integers or type(integers[0]) is int
 
         if not integers:
             return ""
 
-        frame_nums = integers.copy()
-        frame_nums.sort()
+        # Frames that come from files on disk are usually already in order. In that case there is no need to copy them.
+        # The checks compare each integer with the next one through islice, so they do not copy the integers either.
+        if all(map(operator.lt, integers, itertools.islice(integers, 1, None))):
+            # The most common sequence is a single unbroken range of frames. Frames that are in order, have no
+            # duplicates, and span exactly as many values as there are frames must be that range, so there is nothing
+            # to group.
+            if len(integers) > 2 and integers[-1] - integers[0] == len(integers) - 1:
+                return f"{integers[0]}-{integers[-1]}"
+            frame_nums = integers
+        elif all(map(operator.le, integers, itertools.islice(integers, 1, None))):
+            frame_nums = integers
+        else:
+            frame_nums = sorted(integers)
 
-        frame_nums = self._group_list_by_step_size(frame_nums, self.two_pass_sorting)
-        framespec_str = self._convert_grouped_list_into_string(frame_nums)
+        starts, ends = self._group_bounds_by_step_size(frame_nums, self.two_pass_sorting)
+        framespec_str = self._group_bounds_to_string(frame_nums, starts, ends)
 
         return framespec_str
 
+    # ------------------------------------------------------------------------------------------------------------------
+    def _frame_number_groups_to_strings(self,
+                                        result: re.Match) -> tuple:
+        """
+        Given the result of matching a file name against the frame number pattern, return a tuple containing the prefix,
+        the frame number (as a string), and the postfix.
+
+        :param result:
+            The match object returned by the frame number regex.
+
+        :return:
+            A tuple where the first element is the prefix, the second is the frame number as a string, and the third is
+            the postfix.
+        """
+
+        groups = result.groups()
+
+        # The prefix and postfix are almost always a single capture group. In that case they can be read directly from
+        # the match instead of being assembled from a list of groups.
+        prefix_group_numbers = self.prefix_group_numbers
+        if len(prefix_group_numbers) == 1:
+            prefix_str = groups[prefix_group_numbers[0]]
+        else:
+            prefix_str = "".join([groups[prefix_group_number] for prefix_group_number in prefix_group_numbers])
+
+        postfix_group_numbers = self.postfix_group_numbers
+        if len(postfix_group_numbers) == 1:
+            postfix_str = groups[postfix_group_numbers[0]]
+        else:
+            postfix_str = "".join([groups[postfix_group_number] for postfix_group_number in postfix_group_numbers])
+
+        return prefix_str, groups[self.frame_group_num], postfix_str
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def _frame_number_splitter(self):
+        """
+        Return the function that splits a file name into its prefix, frame number, and postfix. When the default frame
+        number pattern and group numbers are in use, file names are split without the regex.
+
+        This is worked out each time a list of files is processed (rather than once in __init__) so that any changes
+        made to the frame number pattern or the group numbers after the object was created are always honored.
+
+        :return:
+            A function that takes a file name (without a path) and returns a tuple of the prefix, the frame number (as a
+            string), and the postfix, or None if the file name does not match the frame number pattern.
+        """
+
+        if (self.frame_number_pattern == DEFAULT_FRAME_NUMBER_PATTERN
+                and self.prefix_group_numbers == [0]
+                and self.frame_group_num == 1
+                and self.postfix_group_numbers == [2]):
+            return _split_last_number
+
+        return self._split_frame_number_with_regex
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def _split_frame_number_with_regex(self,
+                                       file_n: str) -> tuple | None:
+        """
+        Given a file name (without a path), return a tuple containing the prefix, the frame number (as a string), and the
+        postfix, as extracted by the frame number pattern.
+
+        :param file_n:
+            The file name to split.
+
+        :return:
+            A tuple where the first element is the prefix, the second is the frame number as a string, and the third is
+            the postfix. None if the file name does not match the frame number pattern.
+        """
+
+        result = self._frame_number_re.match(file_n)
+        if result is None:
+            return None
+
+        return self._frame_number_groups_to_strings(result)
+
     # ------------------------------------------------------------------------------------------------------------------
     def _file_list_to_path_prefix_frames_and_postfix(self,
                                                      files: list[str]) -> tuple:
         """
         Given a list of files, return a tuple where the first element is the path, the second element is the prefix
-        (everything leading up to the frame numbers), the third element is a list of frame numbers, and the final
+        (everything leading up to the frame numbers), the third element is a tuple of frame numbers, and the final
         element is the text after the frame number.
 
         For example, given:
@@ -567,7 +1005,7 @@ class Framespec(object):
 
         return:
 
-            ("/my/", "file.", [1, 3, 5, 22], ".ext")
+            ("/my/", "file.", (1, 3, 5, 22), ".ext")
 
         :param files:
             A list of file names. May include paths. If the file names contain a path, all files must be in the same
@@ -597,63 +1035,83 @@ class Framespec(object):
 
         :return:
             A tuple where the first element is the path, the second is everything in the file name up to the frame
-            number, the third is a list of integers that represents the frame numbers, and the final element is the
+            number, the third is a tuple of integers that represents the frame numbers, and the final element is the
             file extension.
         """
 
         assert type(files) is list
-        for file_n in files:
-            assert type(file_n) is str
+        assert not files or type(files[0]) is str
 
         if not files:
             return "", "", "", ""
 
-        frame_nums = list()
+        # The frame numbers are collected as strings and converted to integers in a single pass at the end.
+        frame_strs = list()
 
-        prefix_str = ""
-        postfix_str = ""
-        file_d = ""
-        previous_prefix_str = None
-        previous_postfix_str = None
-        previous_file_d = None
+        # The first file is always run through the frame number splitter (the regex-free scan for the default pattern,
+        # the regex otherwise). It establishes the path, prefix, and postfix that every other file has to share.
+        split_frame_number = self._frame_number_splitter()
 
-        for file_p in files:
-
-            file_d, file_n = os.path.split(file_p)
+        file_d, file_n = os.path.split(files[0])
+        result = split_frame_number(file_n)
+        if result is None:
+            if len(files) > 1:
+                raise ValueError("All file names must be the same (except for the sequence number).")
+            return file_d, file_n, list(), ""
+
+        prefix_str, frame_str, postfix_str = result
+        frame_strs.append(frame_str)
+
+        # When using the default pattern, a file that starts with the full prefix, ends with the postfix, and has only a
+        # frame number in between is guaranteed to produce the same prefix and postfix as the first file. These files
+        # may skip splitting entirely. Anything else falls through to the directory check and the frame number splitter
+        # below.
+        fast_path = split_frame_number is _split_last_number
+        prefix_full = os.path.join(file_d, prefix_str)
+        prefix_len = len(prefix_full)
+        postfix_len = len(postfix_str)
+        # An unsigned frame number can only be trusted if the prefix does not end in a character that would join onto
+        # it. If the prefix ends in "-" the minus sign would belong to the frame, and if it ends in a digit (possible
+        # when the first frame number is negative, like shot1-001) the digits would run together into one number.
+        unsigned_frame_ok = not (prefix_str.endswith("-") or prefix_str[-1:].isdecimal())
+
+        dir_prefix = os.path.join(file_d, "")
+        dir_prefix_len = len(dir_prefix)
+        sep = os.sep
+        altsep = os.altsep
+
+        append = frame_strs.append
+
+        for file_p in files[1:]:
+
+            if fast_path and file_p.startswith(prefix_full) and file_p.endswith(postfix_str):
+                frame_str = file_p[prefix_len:len(file_p) - postfix_len]
+                if frame_str.startswith("-"):
+                    if frame_str[1:].isdecimal():
+                        append(frame_str)
+                        continue
+                elif frame_str.isdecimal() and unsigned_frame_ok:
+                    append(frame_str)
+                    continue
 
-            if previous_file_d is not None and previous_file_d != file_d:
-                raise ValueError("All files must live in the same directory.")
-            previous_file_d = file_d
+            # Only fall back to splitting the path if the file does not obviously live in the first file's directory.
+            file_n = file_p[dir_prefix_len:]
+            if not file_p.startswith(dir_prefix) or sep in file_n or (altsep and altsep in file_n):
+                curr_file_d, file_n = os.path.split(file_p)
+                if curr_file_d != file_d:
+                    raise ValueError("All files must live in the same directory.")
 
-            result = re.match(self.frame_number_pattern, file_n)
-            if result is None and len(files) == 1:
-                prefix_str = file_n
-                frame_nums = list()
-                postfix_str = ""
-                previous_prefix_str = prefix_str
-                previous_postfix_str = postfix_str
-                continue
-
-            if result is None and len(files) > 1:
+            result = split_frame_number(file_n)
+            if result is None:
                 raise ValueError("All file names must be the same (except for the sequence number).")
 
-            prefix = list()
-            for prefix_group_number in self.prefix_group_numbers:
-                prefix.append(result.groups()[prefix_group_number])
-            prefix_str = "".join(prefix)
-
-            postfix = list()
-            for postfix_group_number in self.postfix_group_numbers:
-                postfix.append(result.groups()[postfix_group_number])
-            postfix_str = "".join(postfix)
+            curr_prefix_str, frame_str, curr_postfix_str = result
+            if curr_prefix_str != prefix_str or curr_postfix_str != postfix_str:
+                raise ValueError("All file names must be the same (except for the sequence number).")
 
-            if previous_prefix_str is not None and previous_postfix_str is not None:
-                if prefix_str != previous_prefix_str or postfix_str != previous_postfix_str:
-                    raise ValueError("All file names must be the same (except for the sequence number).")
-            previous_prefix_str = prefix_str
-            previous_postfix_str = postfix_str
+            append(frame_str)
 
-            frame_nums.append(int(result.groups()[self.frame_group_num]))
+        frame_nums = tuple(map(int, frame_strs))
 
         return file_d, prefix_str, frame_nums, postfix_str
 
@@ -673,9 +1131,13 @@ class Framespec(object):
 
         stores the following object level variables:
             self._files_list = ["/my/file.1.ext", "/my/file.3.ext", "/my/file.5.ext", "/my/file.22.ext"]
-            self._frames_list = [1, 3, 5, 22]
-            self._framespec_str = "1-5x2,22"
-            self._condensed_files_str = "/my/file.1-5x2,22.ext"
+            self._frame_ranges = ((1, 3, 5, 22),)
+            self._condensed_prefix_str = "/my/file."
+            self._condensed_postfix_str = ".ext"
+
+        The frames list, framespec string, and condensed file name are not built until they are first requested
+        (grouping the frames is the expensive part, and many callers only want the frames). Until then, they are None.
+        The frames are held as a tuple, so changes made to the frames list do not leak into the framespec string.
 
         :param files:
             A list of file names.
@@ -685,18 +1147,22 @@ class Framespec(object):
         """
 
         assert type(files) is list
-        for file_n in files:
-            assert type(file_n) is str
+        assert not files or type(files[0]) is str
 
         self._files_list = files
-        file_d, prefix_str, self._frames_list, postfix_str = self._file_list_to_path_prefix_frames_and_postfix(files)
-        if self._frames_list:
-            self._framespec_str = self._integers_list_to_framespec(self._frames_list)
+        file_d, prefix_str, frame_nums, postfix_str = self._file_list_to_path_prefix_frames_and_postfix(files)
+
+        if frame_nums:
+            self._frame_ranges = (frame_nums,)
+            self._frames_list = None
         else:
-            self._framespec_str = ""
+            self._frame_ranges = None
+            self._frames_list = frame_nums
 
-        prefix_str = os.path.join(file_d, prefix_str)
-        self._condensed_files_str = f"{prefix_str}{self._framespec_str}{postfix_str}"
+        self._condensed_prefix_str = os.path.join(file_d, prefix_str)
+        self._condensed_postfix_str = postfix_str
+        self._framespec_str = None
+        self._condensed_files_str = None
 
     # ------------------------------------------------------------------------------------------------------------------
     def _process_condensed_files_str(self,
@@ -711,8 +1177,13 @@ class Framespec(object):
         stores the following object level variables:
             self._condensed_files_str = "/my/file.1-5x2,22.ext"
             self._framespec_str = "1-5x2,22"
-            self._frames_list = [1, 3, 5, 22]
-            self._files_list = ["/my/file.1.ext", "/my/file.3.ext", "/my/file.5.ext", "/my/file.22.ext"]
+            self._frame_ranges = (range(1, 6, 2), (22,))
+            self._condensed_prefix_str = "/my/file."
+            self._condensed_postfix_str = ".ext"
+
+        Neither the frames list nor the files list is built until it is first requested (expanding large framespecs is
+        the expensive part). Until then, self._frames_list and self._files_list are None. Both are expanded from the
+        frame ranges, which cannot be changed, so changes made to the frames list do not leak into the files list.
 
         :param condensed_files_str:
             A condensed file string.
@@ -724,12 +1195,27 @@ class Framespec(object):
         assert type(condensed_files_str) is str
 
         self._condensed_files_str = condensed_files_str
-        _, self._framespec_str, _ = self._string_to_prefix_framespec_and_postfix(condensed_files_str)
+        base, self._framespec_str, ext = self._string_to_prefix_framespec_and_postfix(condensed_files_str)
         if self._framespec_str:
-            self._frames_list = self._framespec_to_frame_list(self._framespec_str)
-            self._files_list = self._condensed_file_str_to_file_list(condensed_files_str)
+            frame_ranges = self._framespec_to_frame_ranges(self._framespec_str)
+
+            # The frames come back sorted, so the widest frame number is either the first one (if it is negative) or
+            # the last one. The padding is resolved now so that the files list uses the padding that was in effect when
+            # the string was set. The automatic padding is not stored on the object, so later strings get their own.
+            padding = self.padding
+            if padding is None:
+                padding = max(len(str(frame_ranges[0][0])), len(str(frame_ranges[-1][-1])))
+
+            # The frames list and the files list are only built when they are first requested.
+            self._condensed_prefix_str = base
+            self._condensed_postfix_str = ext
+            self._files_padding = padding
+            self._frame_ranges = frame_ranges
+            self._frames_list = None
+            self._files_list = None
         else:
             self._frames_list = list()
+            self._frame_ranges = None
             self._files_list = [condensed_files_str]
 
     # ------------------------------------------------------------------------------------------------------------------
@@ -748,10 +1234,12 @@ class Framespec(object):
 
         store:
             self._frames_list = [1, 3, 5, 22]
-            self._framespec_str = "1-5x2,22"
             self._condensed_files_str = ""
             self._files_list = []
 
+        The framespec string is built right away. Deferring it would mean holding a second copy of the integers so that
+        changes the caller makes to their list in the meantime could not leak into it.
+
         :param integers:
             A list of integers.
 
@@ -760,11 +1248,11 @@ class Framespec(object):
         """
 
         assert type(integers) is list
-        for integer in integers:
-            assert type(integer) is int
+        assert not integers or type(integers[0]) is int
 
         self._frames_list = integers
-        self._framespec_str = self._integers_list_to_framespec(self._frames_list)
+        self._frame_ranges = None
+        self._framespec_str = self._integers_list_to_framespec(integers)
         self._condensed_files_str = ""
         self._files_list = list()
 
@@ -781,10 +1269,12 @@ class Framespec(object):
 
         store:
             self._framespec_str = "1-5x2,22"
-            self._frames_list = [1, 3, 5, 22]
+            self._frame_ranges = (range(1, 6, 2), (22,))
             self._condensed_files_str = ""
             self._files_list = []
 
+        The frames list is not built until it is first requested. Until then, self._frames_list is None.
+
         :param framespec_str:
             A framespec string.
 
@@ -795,70 +1285,46 @@ class Framespec(object):
         assert type(framespec_str) is str
 
         self._framespec_str = framespec_str
-        self._frames_list = self._framespec_to_frame_list(framespec_str)
+        self._frame_ranges = self._framespec_to_frame_ranges(framespec_str)
+        self._frames_list = None
         self._condensed_files_str = ""
         self._files_list = list()
 
     # ------------------------------------------------------------------------------------------------------------------
-    def _framespec_to_frame_list(self,
-                                 framespec: str) -> list:
+    def _framespec_to_frame_ranges(self,
+                                   framespec: str) -> tuple:
         """
-        Given a framespec, return a list.
+        Given a framespec, return the ranges of frames it covers, in order and without duplicates. The ranges are not
+        expanded, so a framespec like 1-1000000 costs no more than 1-10 until its frames are actually needed.
 
             For example, given a string like:
                 1-10x2,22-30,42
 
-            Return a list of integers like:
+            Return a tuple like:
+                (range(1, 11, 2), range(22, 31), (42,))
+
+            Which, chained together, are the integers:
                 1,3,5,7,9,22,23,24,25,26,27,28,29,30,42
 
         :param framespec:
             The string that contains the frames in a condensed, framespec format.
 
         :return:
-            A list of integers.
+            A tuple of ranges (single frames are one item tuples).
         """
 
         assert type(framespec) is str
         # If there is an illegal character in the framespec, then a programming error has occurred.
-        for char in framespec:
-            assert char in "0123456789-," + self.step_delimiter
-
-        output = list()
-
-        chunks = framespec.split(",")
-        for chunk in chunks:
-            if self.step_delimiter in chunk:
-                range_str, step_str = chunk.split(self.step_delimiter)
-            else:
-                range_str = chunk
-                step_str = "1"
-
-            if "--" in range_str:
-                start_str, end_str = range_str.rsplit("--", 1)
-                end_str = "-" + end_str
-            elif "-" in range_str:
-                start_str, end_str = range_str.rsplit("-", 1)
-            else:
-                start_str = end_str = range_str
+        assert set(framespec).issubset("0123456789-," + self.step_delimiter)
 
-            start = int(start_str)
-            end = int(end_str)
-            step = int(step_str)
+        ranges, in_order = _parse_framespec(framespec, self.step_delimiter)
 
-            if start > end:
-                temp = start
-                start = end
-                end = temp
-
-            if start != end:
-                output.extend(range(start, end + 1, step))
-            else:
-                output.append(start)
-
-        output = list(set(output))
-        output.sort()
-
-        return output
+        # If every range starts after the previous one ends (which is the case for any framespec this class generates)
+        # the ranges can be used as they are. Only overlapping or out of order ranges need to be expanded for the more
+        # expensive de-duplicating sort.
+        if in_order:
+            return ranges
+        return (tuple(sorted(set(itertools.chain.from_iterable(ranges)))),)
 
     # ------------------------------------------------------------------------------------------------------------------
     def _string_to_prefix_framespec_and_postfix(self,
@@ -879,57 +1345,48 @@ class Framespec(object):
 
         assert type(string) is str
 
-        result = re.search(self.framespec_pattern, string)
+        result = self._framespec_re.search(string)
         if not result:
             return string, "", ""
 
-        base = string[:result.span()[0]]
-        ext = string[result.span()[1]:]
-        framespec = string[result.span()[0]:result.span()[1]]
+        start, end = result.span()
 
-        return base, framespec, ext
+        return string[:start], string[start:end], string[end:]
 
     # --------------------------------------------------------------------------------------------------------------
-    def _condensed_file_str_to_file_list(self,
-                                         string: str) -> list:
+    @staticmethod
+    def _frames_to_files_list(base: str,
+                              frames: collections.abc.Iterable,
+                              ext: str,
+                              padding: int) -> list:
         """
-        Given a string, extract the framespec portion and converts that to a list of files.
+        Given the text before the framespec, a list of frames, the text after the framespec, and a padding, return the
+        list of files.
 
-        For example: given "/some/files.1-3.exr", this will return:
+        For example: given "/some/files.", [1, 2, 3], ".exr", and 4, this will return:
 
-        /some/files.1.exr
-        /some/files.2.exr
-        /some/files.3.exr
+        /some/files.0001.exr
+        /some/files.0002.exr
+        /some/files.0003.exr
 
-        :param string:
-            The string to convert.
+        :param base:
+            The text before the frame number.
+        :param frames:
+            An iterable of integers.
+        :param ext:
+            The text after the frame number.
+        :param padding:
+            The number of digits to pad each frame number to. If 0, the frame numbers are not padded.
 
         :return:
             A list of expanded files. Does not test whether these files exist on disk or not.
         """
 
-        assert type(string) is str
-
-        output = list()
-
-        result = re.search(self.framespec_pattern, string)
-        if not result:
-            return [string]
-
-        base, framespec, ext = self._string_to_prefix_framespec_and_postfix(string)
-
-        frames = self._framespec_to_frame_list(framespec)
-
-        if self.padding is None:
-            self.padding = len(str(max(frames)))
+        if padding == 0:
+            return [f"{base}{frame}{ext}" for frame in frames]
 
-        for frame in frames:
-            if self.padding == 0:
-                output.append(f"{base}{frame}{ext}")
-            else:
-                output.append(f"{base}{str(frame).rjust(self.padding, '0')}{ext}")
-
-        return output
+        # zfill keeps the minus sign of negative frames in front of the padding zeros.
+        return [f"{base}{str(frame).zfill(padding)}{ext}" for frame in frames]
 
     # ------------------------------------------------------------------------------------------------------------------
     def separate_list_into_lists_of_similar(self,
@@ -961,28 +1418,21 @@ class Framespec(object):
         """
 
         assert type(files_list) is list
-        for file_n in files_list:
-            assert type(file_n) is str
+        if __debug__:
+            for file_n in files_list:
+                assert type(file_n) is str
 
-        output = list()
         sorting_dict = dict()
 
+        split_frame_number = self._frame_number_splitter()
+
         for file_n in files_list:
 
-            result = re.match(self.frame_number_pattern, file_n)
+            result = split_frame_number(file_n)
 
             if result:
 
-                prefix = list()
-                for prefix_group_number in self.prefix_group_numbers:
-                    prefix.append(result.groups()[prefix_group_number])
-                prefix_str = "".join(prefix)
-
-                postfix = list()
-                for postfix_group_number in self.postfix_group_numbers:
-                    postfix.append(result.groups()[postfix_group_number])
-                postfix_str = "".join(postfix)
-
+                prefix_str, _, postfix_str = result
                 frame_num = True
 
             else:
@@ -996,10 +1446,7 @@ class Framespec(object):
             except KeyError:
                 sorting_dict[(prefix_str, frame_num, postfix_str)] = [file_n]
 
-        for key, item in sorting_dict.items():
-            output.append(item)
-
-        return output
+        return list(sorting_dict.values())
 
     # ------------------------------------------------------------------------------------------------------------------
     @staticmethod
@@ -1021,8 +1468,7 @@ class Framespec(object):
         """
 
         assert type(integers) is list
-        for integer in integers:
-            assert type(integer) is int
+        assert not integers or type(integers[0]) is int
 
         missing = list(set(range(min(integers), max(integers) + 1)) - set(integers))
         missing.sort()
@@ -1421,6 +1867,19 @@ def run_tests():
     except ValueError as e:
         print(e)
 
+    # Error case: The first frame is negative and its prefix ends in a digit. The last file's "12" is its frame number,
+    # so its prefix is "shot" rather than "shot1".
+    print("\n\n\nExample: Error case: Not all the files have the same name (prefix ends in a digit).")
+    files_list = ["/some/shot1-001.exr",
+                  "/some/shot1-002.exr",
+                  "/some/shot12.exr"]
+    framespec_obj = Framespec()
+    print(files_list)
+    try:
+        framespec_obj.files_list = files_list
+    except ValueError as e:
+        print(e)
+
     # Error case: Not all the files have frame numbers.
     print("\n\n\nExample: Error case: Not all the files have frame numbers.")
     files_list = ["/some/file.1.ext",
@@ -76,16 +76,9 @@ def build_random_list(start,
         A list consisting of "max_values" number of random values, in ascending order.
     """
 
-    output = list()
-
-    for i in range(max_values):
-        rand = None
-        counter = 0
-        while rand is None or (rand in output and counter < 1000):
-            counter += 1
-            rand = random.randint(start, end)
-        output.append(rand)
-
+    # Sampling from the range picks unique values directly, instead of retrying random values until an unused one
+    # turns up.
+    output = random.sample(range(start, end + 1), max_values)
     output.sort()
 
     return output